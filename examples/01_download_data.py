@@ -5,6 +5,9 @@ This example demonstrates how to download datasets from the USDA Forest Service
 Enterprise Data Warehouse.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from usda_forest_viz import DatasetDownloader
 
 
@@ -66,16 +69,24 @@ def main():
         ("Actv_RngVegImprove", "shapefile"),
     ]
     
-    for dataset_name, format_type in datasets_to_download:
-        try:
-            print(f"\n  Downloading {dataset_name}...")
-            path = downloader.download_dataset(
-                name=dataset_name,
-                format=format_type
-            )
-            print(f"  ✓ Downloaded to: {path}")
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
+    # Downloads are independent and network-bound, so run them concurrently
+    print_lock = threading.Lock()
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(downloader.download_dataset, name=dataset_name, format=format_type): dataset_name
+            for dataset_name, format_type in datasets_to_download
+        }
+        
+        for future in as_completed(futures):
+            dataset_name = futures[future]
+            try:
+                path = future.result()
+                with print_lock:
+                    print(f"  ✓ {dataset_name} downloaded to: {path}")
+            except Exception as e:
+                with print_lock:
+                    print(f"  ✗ {dataset_name} error: {e}")
     
     print("\n" + "=" * 80)
     print("Download complete!")
@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from usda_forest_viz import StaticMapVisualizer
-from usda_forest_viz.utils import load_shapefile, filter_by_attribute, calculate_area
+from usda_forest_viz.utils import load_shapefile, calculate_area
 import matplotlib.pyplot as plt
 
 
@@ -27,13 +27,14 @@ def main():
         print("Please run 01_download_data.py first to download the datasets.")
         return
     
-    # Load the timber harvest data
+    # Load the first 1000 features of the timber harvest data; the limit
+    # is applied by the reader, so the rest of the file is never parsed
     print("\nLoading timber harvest data...")
-    gdf = load_shapefile(data_path)
+    gdf = load_shapefile(data_path, max_features=1000)
     
     # Display basic information
     print(f"\nDataset information:")
-    print(f"  - Total features: {len(gdf)}")
+    print(f"  - Sample features: {len(gdf)}")
     print(f"  - CRS: {gdf.crs}")
     print(f"  - Columns: {', '.join(gdf.columns[:10])}...")
     
@@ -46,7 +47,7 @@ def main():
     print("=" * 80)
     
     fig = viz.plot_polygons(
-        gdf.head(1000),  # Plot first 1000 features for speed
+        gdf,
         title="USDA Forest Service Timber Harvests",
         figsize=(15, 10),
         alpha=0.6,
@@ -73,7 +74,7 @@ def main():
     print(f"Coloring by: {color_col}")
     
     fig = viz.plot_polygons(
-        gdf.head(1000),
+        gdf,
         column=color_col,
         title=f"Timber Harvests by {color_col}",
         cmap="tab20",
@@ -88,7 +89,7 @@ def main():
     print("=" * 80)
     
     # Calculate areas
-    gdf_with_area = calculate_area(gdf.head(1000), unit="acres")
+    gdf_with_area = calculate_area(gdf, unit="acres")
     
     fig = viz.plot_choropleth(
         gdf_with_area,
@@ -105,25 +106,35 @@ def main():
     print("Example 4: Filtered Dataset")
     print("=" * 80)
     
-    # Get unique values for filtering
+    # Choose a column for filtering
     if 'STATE_ABBR' in gdf.columns:
         filter_col = 'STATE_ABBR'
-        # Get most common state
-        filter_value = gdf[filter_col].value_counts().index[0]
     elif 'REGION' in gdf.columns:
         filter_col = 'REGION'
-        filter_value = gdf[filter_col].value_counts().index[0]
     else:
         filter_col = color_col
-        filter_value = gdf[color_col].value_counts().index[0]
+    
+    # Find the most common value from the attribute column alone,
+    # without reading any geometries
+    values = load_shapefile(data_path, columns=[filter_col], read_geometry=False)
+    filter_value = values[filter_col].value_counts().index[0]
     
     print(f"Filtering by {filter_col} = {filter_value}")
     
-    gdf_filtered = filter_by_attribute(gdf, filter_col, filter_value)
+    # Let the reader apply the filter instead of loading everything first
+    if isinstance(filter_value, str):
+        literal = "'" + filter_value.replace("'", "''") + "'"
+    else:
+        literal = filter_value
+    gdf_filtered = load_shapefile(
+        data_path,
+        where=f"{filter_col} = {literal}",
+        max_features=500
+    )
     
     if len(gdf_filtered) > 0:
         fig = viz.plot_polygons(
-            gdf_filtered.head(500),
+            gdf_filtered,
             title=f"Timber Harvests - {filter_col}: {filter_value}",
             figsize=(12, 10),
             color='forestgreen',
@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from usda_forest_viz import InteractiveMapVisualizer
-from usda_forest_viz.utils import load_shapefile, filter_by_attribute
+from usda_forest_viz.utils import load_shapefile
 
 
 def main():
@@ -26,13 +26,11 @@ def main():
         print("Please run 01_download_data.py first to download the datasets.")
         return
     
-    # Load the data
+    # For interactive maps, we'll use a subset to keep file size reasonable;
+    # the limit is applied by the reader, so the rest of the file is never parsed
     print("\nLoading timber harvest data...")
-    gdf = load_shapefile(data_path)
-    
-    # For interactive maps, we'll use a subset to keep file size reasonable
-    print(f"Using subset of {min(500, len(gdf))} features for interactive map...")
-    gdf_subset = gdf.head(500)
+    gdf_subset = load_shapefile(data_path, max_features=500)
+    print(f"Using subset of {len(gdf_subset)} features for interactive map...")
     
     # Initialize visualizer
     viz = InteractiveMapVisualizer()
@@ -111,19 +109,31 @@ def main():
     print("=" * 80)
     
     # Filter by most common value
-    if 'STATE_ABBR' in gdf.columns:
+    if 'STATE_ABBR' in gdf_subset.columns:
         filter_col = 'STATE_ABBR'
-        filter_value = gdf[filter_col].value_counts().index[0]
-    elif style_col in gdf.columns:
+    elif style_col in gdf_subset.columns:
         filter_col = style_col
-        filter_value = gdf[filter_col].value_counts().index[0]
     else:
         print("Skipping filtered example (no suitable column)")
         return
     
+    # Find the most common value from the attribute column alone,
+    # without reading any geometries
+    values = load_shapefile(data_path, columns=[filter_col], read_geometry=False)
+    filter_value = values[filter_col].value_counts().index[0]
+    
     print(f"Filtering by {filter_col} = {filter_value}")
-    gdf_filtered = filter_by_attribute(gdf, filter_col, filter_value)
-    gdf_filtered = gdf_filtered.head(500)
+    
+    # Let the reader apply the filter and limit instead of loading everything first
+    if isinstance(filter_value, str):
+        literal = "'" + filter_value.replace("'", "''") + "'"
+    else:
+        literal = filter_value
+    gdf_filtered = load_shapefile(
+        data_path,
+        where=f"{filter_col} = {literal}",
+        max_features=500
+    )
     
     if len(gdf_filtered) > 0:
         m = viz.create_map(
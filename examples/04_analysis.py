@@ -12,10 +12,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from usda_forest_viz.utils import (
     load_shapefile,
+    iter_shapefile,
     calculate_area,
-    get_summary_statistics,
-    filter_by_attribute,
-    create_buffer
+    create_buffer,
+    build_summary_cube,
+    summary_columns,
+    save_summary_cube,
+    load_summary_cube
 )
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -33,59 +36,75 @@ def main():
         print("Please run 01_download_data.py first to download the datasets.")
         return
     
-    # Load the data
-    print("\nLoading timber harvest data...")
-    gdf = load_shapefile(data_path)
+    # The summaries below are pre-aggregated once and cached next to the
+    # data, so repeat runs read a small file instead of the whole dataset
+    summary_path = data_path / "dataset.summaries.parquet"
+    data_mtime = max(path.stat().st_mtime for path in data_path.glob("*.shp"))
+    
+    if summary_path.exists() and summary_path.stat().st_mtime >= data_mtime:
+        print(f"\nLoading cached summaries from {summary_path}...")
+        cube = load_summary_cube(summary_path)
+    else:
+        # Load the data in batches, calculating areas as we go. Only the
+        # attribute columns the summaries use are read and kept, so neither
+        # the geometries nor the rest of the attribute table is ever held
+        # in memory at once.
+        print("\nLoading timber harvest data and calculating areas in acres...")
+        sample = load_shapefile(data_path, read_geometry=False, max_features=1)
+        columns = summary_columns(sample)
+        batches = []
+        
+        for batch in iter_shapefile(data_path, batch_size=50_000, columns=columns):
+            batch = calculate_area(batch, unit="acres", inplace=True)
+            batches.append(pd.DataFrame(batch.drop(columns=batch.geometry.name)))
+        
+        df_with_area = pd.concat(batches, ignore_index=True)
+        del batches
+        
+        print(f"Loaded {len(df_with_area)} features")
+        
+        cube = build_summary_cube(df_with_area, area_column="area_acres")
+        del df_with_area
+        
+        save_summary_cube(cube, summary_path)
     
     # Example 1: Calculate areas
     print("\n" + "=" * 80)
     print("Example 1: Area Calculation")
     print("=" * 80)
     
-    print("Calculating areas in acres...")
-    gdf_with_area = calculate_area(gdf, unit="acres")
-    
-    print(f"\nTotal treated area: {gdf_with_area['area_acres'].sum():,.2f} acres")
-    print(f"Average treatment size: {gdf_with_area['area_acres'].mean():,.2f} acres")
-    print(f"Median treatment size: {gdf_with_area['area_acres'].median():,.2f} acres")
-    print(f"Largest treatment: {gdf_with_area['area_acres'].max():,.2f} acres")
-    print(f"Smallest treatment: {gdf_with_area['area_acres'].min():,.2f} acres")
+    area = cube["area"]["area_acres"]
+    print(f"\nTotal treated area: {area['sum']:,.2f} acres")
+    print(f"Average treatment size: {area['mean']:,.2f} acres")
+    print(f"Median treatment size: {area['median']:,.2f} acres")
+    print(f"Largest treatment: {area['max']:,.2f} acres")
+    print(f"Smallest treatment: {area['min']:,.2f} acres")
     
     # Example 2: Summary statistics
     print("\n" + "=" * 80)
     print("Example 2: Summary Statistics")
     print("=" * 80)
     
-    stats = get_summary_statistics(gdf_with_area)
     print("\nSummary statistics:")
-    print(stats.to_string())
+    print(cube["statistics"].to_string())
     
     # Example 3: Group by analysis
     print("\n" + "=" * 80)
     print("Example 3: Groupby Analysis")
     print("=" * 80)
     
-    # Find categorical columns
-    categorical_cols = gdf_with_area.select_dtypes(include=['object']).columns
-    categorical_cols = [col for col in categorical_cols if col != 'geometry']
-    
-    if len(categorical_cols) > 0:
-        group_col = categorical_cols[0]
-        print(f"\nGrouping by: {group_col}")
+    if "by_group" in cube:
+        by_group = cube["by_group"]
+        print(f"\nGrouping by: {by_group.index.name}")
         
         # Count by group
-        counts = gdf_with_area[group_col].value_counts().head(10)
+        counts = by_group["count"].sort_values(ascending=False).head(10)
         print(f"\nTop 10 categories by count:")
         print(counts.to_string())
         
         # Area by group
-        if 'area_acres' in gdf_with_area.columns:
-            area_by_group = gdf_with_area.groupby(group_col)['area_acres'].agg([
-                ('count', 'count'),
-                ('total_acres', 'sum'),
-                ('avg_acres', 'mean'),
-                ('median_acres', 'median')
-            ]).sort_values('total_acres', ascending=False).head(10)
+        if "total_acres" in by_group.columns:
+            area_by_group = by_group.sort_values('total_acres', ascending=False).head(10)
             
             print(f"\nTop 10 categories by total area:")
             print(area_by_group.to_string())
@@ -95,44 +114,24 @@ def main():
     print("Example 4: Temporal Analysis")
     print("=" * 80)
     
-    # Find date columns
-    date_cols = [col for col in gdf_with_area.columns 
-                 if any(term in col.upper() for term in ['DATE', 'YEAR', 'TIME'])]
-    
-    if len(date_cols) > 0:
-        date_col = date_cols[0]
-        print(f"\nAnalyzing temporal patterns using: {date_col}")
+    if "by_year" in cube:
+        # Treatments by year
+        yearly_counts = cube["by_year"]["count"].sort_index()
+        print(f"\nTreatments by year:")
+        print(yearly_counts.tail(10).to_string())
         
-        try:
-            # Convert to datetime if not already
-            gdf_with_area[f'{date_col}_parsed'] = pd.to_datetime(
-                gdf_with_area[date_col], 
-                errors='coerce'
-            )
-            
-            # Extract year
-            gdf_with_area['year'] = gdf_with_area[f'{date_col}_parsed'].dt.year
-            
-            # Treatments by year
-            yearly_counts = gdf_with_area['year'].value_counts().sort_index()
-            print(f"\nTreatments by year:")
-            print(yearly_counts.tail(10).to_string())
-            
-            # Create bar chart
-            if len(yearly_counts) > 0:
-                plt.figure(figsize=(12, 6))
-                yearly_counts.sort_index().plot(kind='bar')
-                plt.title('Timber Harvest Activities by Year')
-                plt.xlabel('Year')
-                plt.ylabel('Number of Activities')
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                plt.savefig('../outputs/05_temporal_analysis.png', dpi=300)
-                plt.close()
-                print("\n✓ Temporal analysis chart saved to outputs/05_temporal_analysis.png")
-            
-        except Exception as e:
-            print(f"Could not parse dates: {e}")
+        # Create bar chart
+        if len(yearly_counts) > 0:
+            plt.figure(figsize=(12, 6))
+            yearly_counts.plot(kind='bar')
+            plt.title('Timber Harvest Activities by Year')
+            plt.xlabel('Year')
+            plt.ylabel('Number of Activities')
+            plt.xticks(rotation=45)
+            plt.tight_layout()
+            plt.savefig('../outputs/05_temporal_analysis.png', dpi=300)
+            plt.close()
+            print("\n✓ Temporal analysis chart saved to outputs/05_temporal_analysis.png")
     else:
         print("No date columns found for temporal analysis")
     
@@ -141,10 +140,8 @@ def main():
     print("Example 5: State-level Analysis")
     print("=" * 80)
     
-    if 'STATE_ABBR' in gdf_with_area.columns:
-        state_summary = gdf_with_area.groupby('STATE_ABBR').agg({
-            'area_acres': ['count', 'sum', 'mean']
-        }).round(2)
+    if "by_state" in cube:
+        state_summary = cube["by_state"].round(2)
         state_summary.columns = ['Count', 'Total_Acres', 'Avg_Acres']
         state_summary = state_summary.sort_values('Total_Acres', ascending=False)
         
@@ -168,14 +165,15 @@ def main():
     print("=" * 80)
     
     print("Creating 1000-meter buffer zones around sample features...")
-    sample = gdf_with_area.head(100)
-    buffered = create_buffer(sample, distance=1000, unit="meters")
+    sample = calculate_area(load_shapefile(data_path, max_features=100), unit="acres")
+    # The buffers are only measured, so keep them in the projected CRS
+    buffered = create_buffer(sample, distance=1000, unit="meters", keep_projected=True)
     
     print(f"Original features: {len(sample)}")
     print(f"Buffered features: {len(buffered)}")
     print(f"Original total area: {sample['area_acres'].sum():,.2f} acres")
     
-    buffered_with_area = calculate_area(buffered, unit="acres")
+    buffered_with_area = calculate_area(buffered, unit="acres", inplace=True)
     print(f"Buffered total area: {buffered_with_area['area_acres'].sum():,.2f} acres")
     
     print("\n" + "=" * 80)
@@ -186,4 +184,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
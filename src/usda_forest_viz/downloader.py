@@ -3,12 +3,21 @@ Dataset downloading utilities for USDA Forest Service data.
 """
 
 import os
+import json
+import mmap
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tqdm import tqdm
 from urllib.parse import urljoin
 import zipfile
-import io
+
+from usda_forest_viz.utils import convert_to_parquet
 
 
 class DatasetDownloader:
@@ -22,6 +31,9 @@ class DatasetDownloader:
     
     BASE_URL = "https://data.fs.usda.gov/geodata/edw/"
     
+    # Number of parallel HTTP range requests used per download
+    DEFAULT_CONNECTIONS = 8
+    
     # Common dataset names and their download URLs
     DATASETS = {
         "Actv_TimberHarvest": {
@@ -66,6 +78,32 @@ class DatasetDownloader:
         
         self.shapefile_dir.mkdir(parents=True, exist_ok=True)
         self.geodatabase_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Shared keep-alive session so connections are pooled across
+        # downloads, with room for a few concurrent multi-connection
+        # downloads and retries with backoff on transient server errors
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            ),
+            pool_connections=self.DEFAULT_CONNECTIONS,
+            pool_maxsize=4 * self.DEFAULT_CONNECTIONS
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "DatasetDownloader":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def list_available_datasets(self) -> list[str]:
         """
@@ -80,15 +118,34 @@ class DatasetDownloader:
         self,
         name: str,
         format: Literal["shapefile", "geodatabase"] = "shapefile",
-        force: bool = False
+        force: bool = False,
+        update: bool = False,
+        connections: int = DEFAULT_CONNECTIONS,
+        to_parquet: bool = True
     ) -> Path:
         """
         Download a dataset from the USDA Forest Service.
         
+        When the server supports byte ranges, the file is fetched with
+        several concurrent range requests; otherwise it is streamed over
+        a single connection. Range requests carry an ``If-Range`` validator
+        from the probe, so if the file changes mid-download the parts are
+        discarded and the new file is streamed instead.
+        
+        The ETag, Last-Modified and Content-Length headers of each download
+        are stored in a ``<name>.meta.json`` file next to the dataset, so
+        ``update=True`` only re-downloads when the remote file has changed.
+        
+        Shapefiles are also converted to GeoParquet after extraction (see
+        utils.convert_to_parquet), which load_shapefile then reads instead.
+        
         Args:
             name: Dataset name (e.g., 'Actv_TimberHarvest')
             format: File format ('shapefile' or 'geodatabase')
             force: If True, re-download even if file exists
+            update: If True, re-download only if the remote file has changed
+            connections: Number of parallel connections (1 disables ranges)
+            to_parquet: If True, write a GeoParquet copy of each shapefile
             
         Returns:
             Path to the downloaded dataset
@@ -120,43 +177,303 @@ class DatasetDownloader:
             output_dir = self.geodatabase_dir / name
         
         # Check if already downloaded
-        if output_dir.exists() and not force:
+        if output_dir.exists() and not force and not update:
             print(f"Dataset '{name}' already exists at {output_dir}")
             return output_dir
         
+        # Validators from the previous download, if any
+        metadata = None
+        if output_dir.exists() and not force:
+            metadata = self._read_metadata(output_dir)
+        
+        # Probe size and range support before downloading
+        head = self._session.head(url, allow_redirects=True)
+        
+        if metadata and head.ok and self._is_unchanged(metadata, head.headers):
+            print(f"Dataset '{name}' is up to date at {output_dir}")
+            return output_dir
+        
         print(f"Downloading {name} ({format}) from USDA Forest Service...")
         print(f"URL: {url}")
         
-        # Download the file
-        response = requests.get(url, stream=True)
+        total_size = int(head.headers.get('content-length', 0)) if head.ok else 0
+        accepts_ranges = head.ok and head.headers.get('accept-ranges', '').lower() == 'bytes'
+        
+        # If-Range only accepts a strong ETag or a Last-Modified date
+        validator = head.headers.get('etag')
+        if not validator or validator.startswith('W/'):
+            validator = head.headers.get('last-modified')
+        
+        zip_path = None
+        if connections > 1 and total_size > 0 and accepts_ranges and validator:
+            print(f"Downloading {total_size / (1024*1024):.1f} MB...")
+            zip_path = self._download_ranges(url, total_size, connections, validator)
+            if zip_path is None:
+                print("Remote file changed during the download, restarting...")
+        
+        if zip_path is not None:
+            try:
+                print("Extracting...")
+                self._metadata_path(output_dir).unlink(missing_ok=True)
+                self._extract(zip_path, output_dir)
+            finally:
+                os.unlink(zip_path)
+            
+            self._write_metadata(output_dir, head.headers)
+            if to_parquet and format == "shapefile":
+                self._convert_shapefiles(output_dir)
+            
+            print(f"Successfully downloaded and extracted to {output_dir}")
+            return output_dir
+        
+        # Fall back to a single streamed request, made conditional on the
+        # validators of the previous download
+        headers = {}
+        if metadata:
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+        
+        response = self._session.get(url, headers=headers, stream=True)
         response.raise_for_status()
         
+        if response.status_code == 304:
+            response.close()
+            print(f"Dataset '{name}' is up to date at {output_dir}")
+            return output_dir
+        
         # Get total file size
         total_size = int(response.headers.get('content-length', 0))
         
-        # Download and extract
         print(f"Downloading {total_size / (1024*1024):.1f} MB...")
         
-        # Read the zip file from memory
-        zip_data = io.BytesIO()
-        downloaded = 0
+        zip_path = self._download_stream(response, show_progress=True)
+        try:
+            print("Extracting...")
+            self._metadata_path(output_dir).unlink(missing_ok=True)
+            self._extract(zip_path, output_dir)
+        finally:
+            os.unlink(zip_path)
+        
+        self._write_metadata(output_dir, response.headers)
+        if to_parquet and format == "shapefile":
+            self._convert_shapefiles(output_dir)
+        
+        print(f"Successfully downloaded and extracted to {output_dir}")
+        return output_dir
+    
+    def _convert_shapefiles(self, output_dir: Path):
+        """
+        Write a GeoParquet copy of every shapefile in a dataset directory.
+        
+        Args:
+            output_dir: Directory the dataset was extracted to
+        """
+        for shp_path in sorted(output_dir.glob("*.shp")):
+            print(f"Converting {shp_path.name} to GeoParquet...")
+            convert_to_parquet(output_dir, shp_path.stem)
+    
+    def _metadata_path(self, output_dir: Path) -> Path:
+        """Path of the sidecar file holding a dataset's HTTP validators."""
+        return output_dir.parent / f"{output_dir.name}.meta.json"
+    
+    def _read_metadata(self, output_dir: Path) -> Optional[dict]:
+        """
+        Read the HTTP validators stored for a downloaded dataset.
+        
+        Args:
+            output_dir: Directory the dataset was extracted to
+            
+        Returns:
+            Dictionary of validators, or None if none were stored
+        """
+        path = self._metadata_path(output_dir)
+        if not path.exists():
+            return None
+        
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_metadata(self, output_dir: Path, headers):
+        """
+        Store the HTTP validators of a completed download.
+        
+        Args:
+            output_dir: Directory the dataset was extracted to
+            headers: Response headers of the download
+        """
+        metadata = {
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "content_length": headers.get("content-length"),
+        }
+        self._metadata_path(output_dir).write_text(json.dumps(metadata, indent=2))
+    
+    def _is_unchanged(self, metadata: dict, headers) -> bool:
+        """
+        Check whether a remote file matches the stored validators.
+        
+        Args:
+            metadata: Validators stored by a previous download
+            headers: Response headers of a HEAD request
+            
+        Returns:
+            True if the remote file is known to be unchanged
+        """
+        etag = headers.get("etag")
+        if etag and metadata.get("etag"):
+            return etag == metadata["etag"]
+        
+        last_modified = headers.get("last-modified")
+        if last_modified and metadata.get("last_modified"):
+            content_length = headers.get("content-length")
+            return (
+                last_modified == metadata["last_modified"]
+                and content_length == metadata.get("content_length")
+            )
+        
+        return False
+    
+    def _download_stream(self, response: requests.Response, show_progress: bool = False) -> Path:
+        """
+        Stream a response body to a temporary file on disk.
+        
+        Writing to disk instead of an in-memory buffer keeps peak memory
+        bounded by the chunk size rather than the archive size.
+        
+        Args:
+            response: Streaming response to read from
+            show_progress: Whether to print download progress
+            
+        Returns:
+            Path to the temporary file holding the downloaded bytes
+        """
+        total_size = int(response.headers.get('content-length', 0))
+        
+        tmp = tempfile.NamedTemporaryFile(dir=self.data_dir, suffix=".zip", delete=False)
+        try:
+            with tmp, tqdm(
+                total=total_size or None,
+                unit="B",
+                unit_scale=True,
+                disable=not show_progress
+            ) as progress:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    tmp.write(chunk)
+                    progress.update(len(chunk))
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
         
-        for chunk in response.iter_content(chunk_size=8192):
-            zip_data.write(chunk)
-            downloaded += len(chunk)
-            if total_size > 0:
-                percent = (downloaded / total_size) * 100
-                print(f"\rProgress: {percent:.1f}%", end="", flush=True)
+        return Path(tmp.name)
+    
+    def _download_ranges(
+        self,
+        url: str,
+        total_size: int,
+        connections: int,
+        validator: str
+    ) -> Optional[Path]:
+        """
+        Download a file using parallel HTTP range requests.
+        
+        Each worker writes its byte range directly into a memory-mapped,
+        pre-allocated temporary file at the matching offset. Every request
+        sends ``If-Range`` with the validator, so a server holding a
+        different version answers 200 with the whole file instead of mixing
+        bytes of two versions.
+        
+        Args:
+            url: URL of the file
+            total_size: File size in bytes (from Content-Length)
+            connections: Number of concurrent range requests
+            validator: Strong ETag or Last-Modified date of the file
+            
+        Returns:
+            Path to the temporary file holding the downloaded bytes, or None
+            if the file no longer matches the validator
+        """
+        part_size = -(-total_size // connections)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+        
+        tmp = tempfile.NamedTemporaryFile(dir=self.data_dir, suffix=".zip", delete=False)
+        lock = threading.Lock()
+        changed = threading.Event()
+        
+        try:
+            with tmp:
+                tmp.truncate(total_size)
+                with (
+                    mmap.mmap(tmp.fileno(), total_size) as buffer,
+                    tqdm(total=total_size, unit="B", unit_scale=True) as progress,
+                ):
+                    def fetch(start: int, end: int):
+                        response = self._session.get(
+                            url,
+                            headers={"Range": f"bytes={start}-{end}", "If-Range": validator},
+                            stream=True
+                        )
+                        response.raise_for_status()
+                        if response.status_code == 200:
+                            # The file changed, so the other parts are stale too
+                            response.close()
+                            changed.set()
+                            return
+                        if response.status_code != 206:
+                            raise requests.RequestException(
+                                f"Server ignored range request for {url}"
+                            )
+                        
+                        offset = start
+                        for chunk in response.iter_content(chunk_size=1 << 20):
+                            if changed.is_set():
+                                response.close()
+                                return
+                            if offset + len(chunk) > end + 1:
+                                raise requests.RequestException(
+                                    f"Server returned more data than requested for {url}"
+                                )
+                            buffer[offset:offset + len(chunk)] = chunk
+                            offset += len(chunk)
+                            with lock:
+                                progress.update(len(chunk))
+                        
+                        if offset != end + 1:
+                            raise requests.RequestException(
+                                f"Incomplete range {start}-{end} for {url}"
+                            )
+                    
+                    with ThreadPoolExecutor(max_workers=connections) as executor:
+                        futures = [executor.submit(fetch, start, end) for start, end in ranges]
+                        for future in futures:
+                            future.result()
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
         
-        print("\nExtracting...")
+        if changed.is_set():
+            os.unlink(tmp.name)
+            return None
         
-        # Extract the zip file
-        with zipfile.ZipFile(zip_data) as zip_ref:
+        return Path(tmp.name)
+    
+    def _extract(self, zip_source, output_dir: Path):
+        """
+        Extract a zip archive into the output directory.
+        
+        Args:
+            zip_source: Path or file-like object of the zip archive
+            output_dir: Directory to extract into
+        """
+        with zipfile.ZipFile(zip_source) as zip_ref:
             output_dir.mkdir(parents=True, exist_ok=True)
             zip_ref.extractall(output_dir)
-        
-        print(f"Successfully downloaded and extracted to {output_dir}")
-        return output_dir
     
     def get_dataset_info(self, name: str) -> dict:
         """
@@ -201,17 +518,15 @@ class DatasetDownloader:
         
         print(f"Downloading custom dataset from {url}...")
         
-        response = requests.get(url, stream=True)
+        response = self._session.get(url, stream=True)
         response.raise_for_status()
         
-        zip_data = io.BytesIO()
-        for chunk in response.iter_content(chunk_size=8192):
-            zip_data.write(chunk)
-        
-        print("Extracting...")
-        with zipfile.ZipFile(zip_data) as zip_ref:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            zip_ref.extractall(output_dir)
+        zip_path = self._download_stream(response)
+        try:
+            print("Extracting...")
+            self._extract(zip_path, output_dir)
+        finally:
+            os.unlink(zip_path)
         
         print(f"Successfully downloaded to {output_dir}")
         return output_dir
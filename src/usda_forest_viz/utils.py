@@ -2,23 +2,424 @@
 Utility functions for working with USDA Forest Service datasets.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple, Union
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 
+# Low-cardinality attribute columns common to the EDW activity datasets
+_CATEGORICAL_COLUMNS = ("STATE_ABBR", "REGION", "ACTIVITY", "TYPE_NAME", "METHOD")
 
-def load_shapefile(directory: Path, name: Optional[str] = None) -> gpd.GeoDataFrame:
+# Column of GeoParquet copies holding each feature's position in the shapefile
+_FEATURE_ID = "_fid"
+
+
+def load_shapefile(
+    directory: Path,
+    name: Optional[str] = None,
+    columns: Optional[list] = None,
+    read_geometry: bool = True,
+    where: Optional[str] = None,
+    max_features: Optional[int] = None,
+    filters: Optional[list] = None,
+    spatial_index: bool = False,
+    bbox: Optional[Tuple[float, float, float, float]] = None
+) -> Union[gpd.GeoDataFrame, pd.DataFrame]:
     """
     Load a shapefile from a directory.
     
+    If an up-to-date GeoParquet copy (``<name>.parquet``, see
+    convert_to_parquet) exists next to the shapefile, it is read instead;
+    ``filters`` are then pushed down to Parquet so only matching row
+    groups are decoded. Otherwise the shapefile is read with the pyogrio
+    engine through Arrow, and ``where``/``bbox``/``max_features`` are applied
+    by GDAL while reading, so features that are not needed are never parsed.
+    Features are returned in shapefile order either way.
+    For ``bbox``, GDAL skips whole index cells when a ``.qix`` or ``.sbn``
+    spatial index exists next to the shapefile.
+    
     Args:
         directory: Directory containing shapefile
         name: Specific shapefile name (without .shp extension). If None, loads first .shp found
+        columns: Attribute columns to read (if None, reads all columns)
+        read_geometry: If False, skips geometries and returns a plain DataFrame
+        where: SQL WHERE clause to filter features (e.g., "STATE_ABBR = 'CA'");
+            always read from the shapefile
+        max_features: Maximum number of features to read; always read from
+            the shapefile
+        filters: Parquet row filters (e.g., [("STATE_ABBR", "=", "CA")]);
+            requires a GeoParquet copy
+        spatial_index: If True, build the spatial index up front so later
+            bounding-box queries (e.g., filter_by_bounds) reuse it
+        bbox: Only read features intersecting this bounding box
+            (minx, miny, maxx, maxy) in the data's CRS; always read from the
+            shapefile. Prefer this over loading everything and calling
+            filter_by_bounds.
+        
+    Returns:
+        GeoDataFrame, or DataFrame when read_geometry is False
+        
+    Raises:
+        FileNotFoundError: If no shapefile found
+        ValueError: If filters are given but no GeoParquet copy can be used
+    """
+    shp_path = _find_shapefile(directory, name)
+    parquet_path = shp_path.with_suffix(".parquet")
+    
+    use_parquet = (
+        where is None and bbox is None and max_features is None
+        and _is_fresh(parquet_path, shp_path)
+        and _has_feature_ids(parquet_path)
+    )
+    if filters is not None and not use_parquet:
+        raise ValueError(
+            f"filters require an up-to-date GeoParquet copy of {shp_path} "
+            "and cannot be combined with where, bbox or max_features; "
+            "run convert_to_parquet() first or use where instead"
+        )
+    
+    if use_parquet:
+        print(f"Loading {parquet_path}...")
+        if columns is None:
+            import pyarrow.parquet as pq
+            columns = [
+                col for col in pq.read_schema(parquet_path).names
+                if col not in ("geometry", _FEATURE_ID)
+            ]
+        
+        if read_geometry:
+            gdf = gpd.read_parquet(
+                parquet_path,
+                columns=[*columns, _FEATURE_ID, "geometry"],
+                filters=filters
+            )
+        else:
+            gdf = pd.read_parquet(parquet_path, columns=[*columns, _FEATURE_ID], filters=filters)
+        
+        # The copy is stored sorted for filter pushdown; the feature ids
+        # put the rows back in shapefile order
+        gdf = gdf.sort_values(_FEATURE_ID, ignore_index=True).drop(columns=_FEATURE_ID)
+    else:
+        print(f"Loading {shp_path}...")
+        gdf = gpd.read_file(
+            shp_path,
+            engine="pyogrio",
+            use_arrow=True,
+            columns=columns,
+            read_geometry=read_geometry,
+            where=where,
+            bbox=bbox,
+            max_features=max_features
+        )
+    print(f"Loaded {len(gdf)} features")
+    
+    gdf = _categorize(gdf)
+    
+    if spatial_index and read_geometry:
+        ensure_sindex(gdf)
+    
+    return gdf
+
+
+def load_many(
+    paths: list[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> list[Union[gpd.GeoDataFrame, pd.DataFrame]]:
+    """
+    Load several shapefiles concurrently.
+    
+    GDAL releases the GIL while reading, so files are read in parallel on
+    a thread pool. Combine with merge_datasets to get a single frame.
+    
+    Args:
+        paths: Shapefile directories (as for load_shapefile) or .shp files
+        max_workers: Maximum number of files read at once (defaults to the
+            number of CPUs)
+        **kwargs: Passed to load_shapefile for every file (e.g., columns, where)
+        
+    Returns:
+        List of loaded frames, in the order of ``paths``
+        
+    Raises:
+        FileNotFoundError: If a shapefile is not found
+    """
+    def load(path):
+        path = Path(path)
+        if path.suffix.lower() == ".shp":
+            return load_shapefile(path.parent, path.stem, **kwargs)
+        return load_shapefile(path, **kwargs)
+    
+    if not paths:
+        return []
+    
+    max_workers = min(len(paths), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load, paths))
+
+
+def load_shapefile_cached(
+    directory: Path,
+    name: Optional[str] = None,
+    area_unit: Optional[str] = None
+) -> gpd.GeoDataFrame:
+    """
+    Load a shapefile through a GeoParquet cache stored next to it.
+    
+    The first call parses the shapefile and writes ``<name>.parquet``
+    beside it; later calls read the much faster Parquet file as long as
+    it is newer than the shapefile.
+    
+    Computed areas are cached separately in ``<name>.areas.parquet``, so
+    the GeoParquet copy (which load_shapefile also reads) only ever holds
+    the shapefile's own columns.
+    
+    Args:
+        directory: Directory containing shapefile
+        name: Specific shapefile name (without .shp extension). If None, loads first .shp found
+        area_unit: If given, the ``area_<unit>`` column from calculate_area
+            is added, computed once and cached
         
     Returns:
         GeoDataFrame
         
+    Raises:
+        FileNotFoundError: If no shapefile found
+    """
+    shp_path = _find_shapefile(directory, name)
+    parquet_path = shp_path.with_suffix(".parquet")
+    cached = _is_fresh(parquet_path, shp_path) and _has_feature_ids(parquet_path)
+    
+    # Reads the Parquet copy when it is up to date
+    gdf = load_shapefile(directory, name)
+    
+    if not cached:
+        _write_parquet(gdf, parquet_path)
+    
+    if area_unit is None:
+        return gdf
+    
+    # Areas are stored one column per unit, in shapefile order
+    area_column = f"area_{area_unit}"
+    area_path = shp_path.with_suffix(".areas.parquet")
+    areas = pd.read_parquet(area_path) if _is_fresh(area_path, shp_path) else pd.DataFrame()
+    if len(areas) != len(gdf):
+        areas = pd.DataFrame()
+    
+    if area_column in areas.columns:
+        gdf[area_column] = areas[area_column].to_numpy()
+        return gdf
+    
+    gdf = calculate_area(gdf, unit=area_unit, inplace=True)
+    
+    areas[area_column] = gdf[area_column].to_numpy()
+    areas.to_parquet(area_path, compression="zstd")
+    print(f"Cached areas to {area_path}")
+    
+    return gdf
+
+
+def convert_to_parquet(directory: Path, name: Optional[str] = None) -> Path:
+    """
+    Write a GeoParquet copy of a shapefile next to it.
+    
+    Features are sorted by state (when a STATE_ABBR column exists) and
+    written in row groups of 50,000 features, so the per-row-group
+    statistics let filtered reads skip most of the file.
+    load_shapefile picks the copy up automatically.
+    
+    Args:
+        directory: Directory containing shapefile
+        name: Specific shapefile name (without .shp extension). If None, converts first .shp found
+        
+    Returns:
+        Path to the GeoParquet file
+        
+    Raises:
+        FileNotFoundError: If no shapefile found
+    """
+    shp_path = _find_shapefile(directory, name)
+    parquet_path = shp_path.with_suffix(".parquet")
+    
+    gdf = gpd.read_file(shp_path, engine="pyogrio", use_arrow=True)
+    _write_parquet(gdf, parquet_path)
+    
+    return parquet_path
+
+
+def _write_parquet(gdf: gpd.GeoDataFrame, parquet_path: Path):
+    """
+    Write a GeoDataFrame as GeoParquet laid out for row-group pruning.
+    
+    Each row's position in ``gdf`` is stored in the ``_fid`` column, so
+    load_shapefile can return the rows in their original order.
+    
+    Args:
+        gdf: GeoDataFrame to write (in shapefile order)
+        parquet_path: Output file path
+    """
+    gdf = gdf.assign(**{_FEATURE_ID: np.arange(len(gdf), dtype=np.int64)})
+    
+    # Clustering by a low-cardinality column keeps its min/max statistics
+    # tight per row group, which is what makes filter pushdown effective
+    if "STATE_ABBR" in gdf.columns:
+        gdf = gdf.sort_values("STATE_ABBR", kind="stable").reset_index(drop=True)
+    
+    gdf.to_parquet(
+        parquet_path,
+        compression="zstd",
+        geometry_encoding="WKB",
+        row_group_size=50_000
+    )
+    print(f"Cached to {parquet_path}")
+
+
+def _has_feature_ids(parquet_path: Path) -> bool:
+    """
+    Check whether a GeoParquet copy stores the original feature order.
+    
+    Copies written before the ``_fid`` column was added are not used, so
+    they cannot return rows in a different order than the shapefile.
+    
+    Args:
+        parquet_path: Path to the GeoParquet file
+        
+    Returns:
+        True if the copy has a feature id column
+    """
+    import pyarrow.parquet as pq
+    return _FEATURE_ID in pq.read_schema(parquet_path).names
+
+
+def _is_fresh(parquet_path: Path, shp_path: Path) -> bool:
+    """
+    Check whether a GeoParquet copy is newer than its source shapefile.
+    
+    Args:
+        parquet_path: Path to the GeoParquet file
+        shp_path: Path to the .shp file
+        
+    Returns:
+        True if the copy exists and is up to date
+    """
+    if not parquet_path.exists():
+        return False
+    
+    sources = [shp_path.with_suffix(suffix) for suffix in (".shp", ".dbf")]
+    source_mtime = max(path.stat().st_mtime for path in sources if path.exists())
+    return parquet_path.stat().st_mtime >= source_mtime
+
+
+def iter_shapefile(
+    directory: Path,
+    name: Optional[str] = None,
+    batch_size: int = 50_000,
+    columns: Optional[list] = None,
+    where: Optional[str] = None
+) -> Iterator[gpd.GeoDataFrame]:
+    """
+    Read a shapefile in batches of features.
+    
+    Features are streamed from a single GDAL read through Arrow, and only
+    one batch is held in memory at a time, so large datasets can be
+    processed incrementally.
+    
+    Args:
+        directory: Directory containing shapefile
+        name: Specific shapefile name (without .shp extension). If None, reads first .shp found
+        batch_size: Number of features per batch
+        columns: Attribute columns to read (if None, reads all columns)
+        where: SQL WHERE clause to filter features
+        
+    Yields:
+        GeoDataFrame for each batch of features
+        
+    Raises:
+        FileNotFoundError: If no shapefile found
+    """
+    import pyogrio
+    
+    shp_path = _find_shapefile(directory, name)
+    
+    print(f"Reading {shp_path} in batches of {batch_size} features...")
+    with pyogrio.open_arrow(
+        shp_path,
+        columns=columns,
+        where=where,
+        batch_size=batch_size,
+        use_pyarrow=True
+    ) as (meta, reader):
+        geometry_name = meta["geometry_name"] or "wkb_geometry"
+        
+        for record_batch in reader:
+            if record_batch.num_rows == 0:
+                continue
+            
+            df = record_batch.to_pandas()
+            geometry = gpd.GeoSeries.from_wkb(df.pop(geometry_name), crs=meta["crs"])
+            yield gpd.GeoDataFrame(df, geometry=geometry.rename("geometry"))
+
+
+def _categorize(
+    df: pd.DataFrame,
+    max_categories: int = 1024,
+    max_ratio: float = 0.05
+) -> pd.DataFrame:
+    """
+    Store low-cardinality text columns as pandas categoricals.
+    
+    Comparisons against a categorical column compare small integer codes
+    instead of Python strings. Known code columns (see _CATEGORICAL_COLUMNS)
+    are always converted; other text columns are converted when their
+    distinct values make up less than ``max_ratio`` of the rows.
+    
+    Args:
+        df: DataFrame to convert (modified in place)
+        max_categories: Only convert columns with fewer distinct values
+        max_ratio: Maximum ratio of distinct values to rows for columns
+            that are not known code columns
+        
+    Returns:
+        The same DataFrame
+    """
+    for col in df.columns:
+        # Text columns are object dtype on pandas 2 and str on pandas 3;
+        # object columns are checked by their values, since they can also
+        # hold e.g. datetime.date values from DBF Date fields
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            continue
+        if series.dtype == object:
+            if pd.api.types.infer_dtype(series, skipna=True) != "string":
+                continue
+        elif not pd.api.types.is_string_dtype(series.dtype):
+            continue
+        
+        n_unique = df[col].nunique()
+        if n_unique >= max_categories:
+            continue
+        
+        if col in _CATEGORICAL_COLUMNS or n_unique < max_ratio * len(df):
+            df[col] = df[col].astype("category")
+    
+    return df
+
+
+def _find_shapefile(directory: Path, name: Optional[str] = None) -> Path:
+    """
+    Locate a shapefile in a directory.
+    
+    Args:
+        directory: Directory containing shapefile
+        name: Specific shapefile name (without .shp extension). If None, returns first .shp found
+        
+    Returns:
+        Path to the .shp file
+        
     Raises:
         FileNotFoundError: If no shapefile found
     """
@@ -36,20 +437,28 @@ def load_shapefile(directory: Path, name: Optional[str] = None) -> gpd.GeoDataFr
     if not shp_path.exists():
         raise FileNotFoundError(f"Shapefile not found: {shp_path}")
     
-    print(f"Loading {shp_path}...")
-    gdf = gpd.read_file(shp_path)
-    print(f"Loaded {len(gdf)} features")
-    
-    return gdf
+    return shp_path
 
 
-def load_geodatabase(directory: Path, layer: Optional[str] = None) -> gpd.GeoDataFrame:
+def load_geodatabase(
+    directory: Path,
+    layer: Optional[str] = None,
+    columns: Optional[list] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None
+) -> gpd.GeoDataFrame:
     """
     Load a layer from an ESRI File Geodatabase.
     
+    The layer is read with the pyogrio engine through Arrow; ``columns`` and
+    ``bbox`` are applied by GDAL while reading, so unused attributes and
+    features outside the box are never parsed.
+    
     Args:
         directory: Directory containing .gdb folder
         layer: Specific layer name. If None, loads first layer
+        columns: Attribute columns to read (if None, reads all columns)
+        bbox: Only read features intersecting this bounding box
+            (minx, miny, maxx, maxy) in the layer's CRS
         
     Returns:
         GeoDataFrame
@@ -67,8 +476,8 @@ def load_geodatabase(directory: Path, layer: Optional[str] = None) -> gpd.GeoDat
     gdb_path = gdb_dirs[0]
     
     # List available layers
-    import fiona
-    layers = fiona.listlayers(gdb_path)
+    import pyogrio
+    layers = [str(name) for name in pyogrio.list_layers(gdb_path)[:, 0]]
     
     if not layers:
         raise ValueError(f"No layers found in {gdb_path}")
@@ -81,9 +490,37 @@ def load_geodatabase(directory: Path, layer: Optional[str] = None) -> gpd.GeoDat
         layer_name = layers[0]
     
     print(f"Loading layer '{layer_name}' from {gdb_path}...")
-    gdf = gpd.read_file(gdb_path, layer=layer_name)
+    gdf = gpd.read_file(
+        gdb_path,
+        engine="pyogrio",
+        use_arrow=True,
+        layer=layer_name,
+        columns=columns,
+        bbox=bbox
+    )
     print(f"Loaded {len(gdf)} features")
     
+    return _categorize(gdf)
+
+
+def ensure_sindex(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Build the spatial index of a GeoDataFrame now rather than on first use.
+    
+    geopandas caches the index (an STRtree) on the frame, so every later
+    filter_by_bounds or spatial_join call on the same frame reuses it.
+    Call this once after loading and before a loop of bounding-box queries.
+    Frames derived from it (e.g., by filtering or reprojecting) build their
+    own index.
+    
+    Args:
+        gdf: GeoDataFrame to index
+        
+    Returns:
+        The same GeoDataFrame
+    """
+    # Accessing the property builds the index and caches it on the frame
+    _ = gdf.sindex
     return gdf
 
 
@@ -94,6 +531,11 @@ def filter_by_bounds(
     """
     Filter GeoDataFrame by bounding box.
     
+    Candidates are found with the GeoDataFrame's spatial index (an STRtree
+    that is built on first use and reused by later calls on the same frame),
+    so only geometries whose bounds overlap the box are tested exactly. If
+    the box contains the bounds of the whole frame, it is returned as is.
+    
     Args:
         gdf: GeoDataFrame to filter
         bounds: Bounding box (minx, miny, maxx, maxy)
@@ -103,12 +545,23 @@ def filter_by_bounds(
     """
     minx, miny, maxx, maxy = bounds
     
+    # Nothing to prune when the box covers the whole dataset
+    data_minx, data_miny, data_maxx, data_maxy = gdf.total_bounds
+    if (
+        minx <= data_minx and miny <= data_miny
+        and maxx >= data_maxx and maxy >= data_maxy
+        and not (gdf.geometry.isna() | gdf.geometry.is_empty).any()
+    ):
+        print(f"Bounding box covers all {len(gdf)} features")
+        return gdf
+    
     # Create bounding box
     from shapely.geometry import box
     bbox = box(minx, miny, maxx, maxy)
     
-    # Filter features that intersect the bounding box
-    filtered = gdf[gdf.geometry.intersects(bbox)]
+    # Filter features that intersect the bounding box, keeping their order
+    idx = np.sort(gdf.sindex.query(bbox, predicate="intersects"))
+    filtered = gdf.iloc[idx]
     
     print(f"Filtered from {len(gdf)} to {len(filtered)} features")
     
@@ -123,6 +576,9 @@ def filter_by_attribute(
     """
     Filter GeoDataFrame by attribute value.
     
+    Categorical columns of the result only keep the categories that still
+    occur, so e.g. value_counts() does not list filtered-out values.
+    
     Args:
         gdf: GeoDataFrame to filter
         column: Column name
@@ -131,35 +587,53 @@ def filter_by_attribute(
     Returns:
         Filtered GeoDataFrame
     """
+    series = gdf[column]
+    
     if isinstance(value, (list, tuple)):
-        filtered = gdf[gdf[column].isin(value)]
+        filtered = gdf[series.isin(value)]
+    elif isinstance(series.dtype, pd.CategoricalDtype):
+        # Compare integer category codes instead of the values themselves
+        categories = series.cat.categories
+        if value in categories:
+            mask = series.cat.codes.to_numpy() == categories.get_loc(value)
+        else:
+            mask = np.zeros(len(series), dtype=bool)
+        filtered = gdf[mask]
     else:
-        filtered = gdf[gdf[column] == value]
+        filtered = gdf[series == value]
+    
+    categorical = [col for col in filtered.columns if isinstance(filtered[col].dtype, pd.CategoricalDtype)]
+    if categorical:
+        filtered = filtered.copy(deep=False)
+        for col in categorical:
+            filtered[col] = filtered[col].cat.remove_unused_categories()
     
     print(f"Filtered from {len(gdf)} to {len(filtered)} features")
     
     return filtered
 
 
-def calculate_area(gdf: gpd.GeoDataFrame, unit: str = "acres") -> gpd.GeoDataFrame:
+def calculate_area(
+    gdf: gpd.GeoDataFrame,
+    unit: str = "acres",
+    inplace: bool = False
+) -> gpd.GeoDataFrame:
     """
     Calculate area for polygon features.
     
+    Unless ``inplace`` is set, the result is a shallow copy that shares the
+    existing columns (including geometries) with the input rather than
+    duplicating them.
+    
     Args:
         gdf: GeoDataFrame with polygon geometries
         unit: Unit for area calculation ('acres', 'hectares', 'sqm', 'sqkm')
+        inplace: If True, add the area column to ``gdf`` itself
         
     Returns:
         GeoDataFrame with added 'area' column
     """
-    # Reproject to equal-area projection for accurate area calculation
-    # Using Albers Equal Area for US
-    gdf_proj = gdf.to_crs("EPSG:5070")
-    
-    # Calculate area in square meters
-    area_sqm = gdf_proj.geometry.area
-    
-    # Convert to desired unit
+    # Conversion factors from square meters
     conversions = {
         "sqm": 1,
         "sqkm": 1e-6,
@@ -167,22 +641,43 @@ def calculate_area(gdf: gpd.GeoDataFrame, unit: str = "acres") -> gpd.GeoDataFra
         "hectares": 0.0001
     }
     
+    # Validate before the (expensive) reprojection
     if unit not in conversions:
         raise ValueError(f"Unit must be one of: {', '.join(conversions.keys())}")
     
-    gdf = gdf.copy()
-    gdf[f"area_{unit}"] = area_sqm * conversions[unit]
+    # Reproject to equal-area projection for accurate area calculation
+    # Using Albers Equal Area for US (e.g., create_buffer with keep_projected
+    # already returns data in it)
+    if gdf.crs == "EPSG:5070":
+        gdf_proj = gdf
+    else:
+        gdf_proj = gdf.to_crs("EPSG:5070")
+    
+    # Calculate area in square meters for all geometries in one vectorized call
+    area = gdf_proj.geometry.area.to_numpy() * conversions[unit]
+    
+    if not inplace:
+        gdf = gdf.copy(deep=False)
+    gdf[f"area_{unit}"] = area
     
     return gdf
 
 
-def get_summary_statistics(gdf: gpd.GeoDataFrame, columns: Optional[list] = None) -> pd.DataFrame:
+def get_summary_statistics(
+    gdf: gpd.GeoDataFrame,
+    columns: Optional[list] = None,
+    low_memory: bool = False
+) -> pd.DataFrame:
     """
     Get summary statistics for numeric columns.
     
     Args:
         gdf: GeoDataFrame
         columns: Specific columns to summarize (if None, summarizes all numeric columns)
+        low_memory: If True, downcast numeric columns to the smallest integer
+            or float dtype that holds their values before summarizing, which
+            roughly halves the data the statistics have to scan. Results
+            for float columns are then computed in single precision.
         
     Returns:
         DataFrame with summary statistics
@@ -192,21 +687,296 @@ def get_summary_statistics(gdf: gpd.GeoDataFrame, columns: Optional[list] = None
     else:
         df = gdf.select_dtypes(include=['number'])
     
+    if low_memory:
+        df = df.apply(_downcast_numeric)
+    
     return df.describe()
 
 
-def export_to_geojson(gdf: gpd.GeoDataFrame, output_path: str):
+def _downcast_numeric(series: pd.Series) -> pd.Series:
+    """Downcast a numeric Series to the smallest dtype that holds its values."""
+    # Other columns (e.g. explicitly requested text columns) pass through
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series
+    
+    series = pd.to_numeric(series, downcast="integer")
+    if pd.api.types.is_float_dtype(series):
+        series = pd.to_numeric(series, downcast="float")
+    return series
+
+
+def build_summary_cube(
+    df: pd.DataFrame,
+    area_column: str = "area_acres",
+    state_column: str = "STATE_ABBR",
+    group_column: Optional[str] = None,
+    date_column: Optional[str] = None
+) -> dict[str, pd.DataFrame]:
+    """
+    Pre-aggregate the summaries used for dataset analysis.
+    
+    The full table is scanned once; the resulting small tables can be
+    saved with save_summary_cube and reused instead of re-reading the data.
+    
+    Args:
+        df: Attribute table (or GeoDataFrame) with an area column
+        area_column: Column with feature areas (see calculate_area)
+        state_column: Column with state abbreviations
+        group_column: Categorical column to group by (defaults to ACTIVITY,
+            or the first text column)
+        date_column: Date column for yearly counts (defaults to the first
+            column with DATE, YEAR or TIME in its name)
+        
+    Returns:
+        Dictionary of summary tables: 'area', 'statistics', 'by_state',
+        'by_group' and 'by_year' (tables whose columns are missing are omitted)
+    """
+    group_column, date_column = _resolve_summary_columns(df, group_column, date_column)
+    
+    # Suffix for aggregate column names, e.g. 'acres' for 'area_acres'
+    unit = area_column.removeprefix("area_")
+    
+    cube = {}
+    
+    if area_column in df.columns:
+        cube["area"] = df[area_column].agg(
+            ["count", "sum", "mean", "median", "min", "max"]
+        ).to_frame()
+    
+    cube["statistics"] = get_summary_statistics(df)
+    
+    if state_column in df.columns and area_column in df.columns:
+        cube["by_state"] = df.groupby(state_column, observed=True)[area_column].agg(
+            **{"count": "count", f"total_{unit}": "sum", f"avg_{unit}": "mean"}
+        ).sort_values(f"total_{unit}", ascending=False)
+    
+    if group_column is not None and group_column in df.columns:
+        by_group = df.groupby(group_column, observed=True)
+        if area_column in df.columns:
+            cube["by_group"] = by_group[area_column].agg(**{
+                "count": "count",
+                f"total_{unit}": "sum",
+                f"avg_{unit}": "mean",
+                f"median_{unit}": "median"
+            }).sort_values(f"total_{unit}", ascending=False)
+        else:
+            cube["by_group"] = by_group.size().rename("count").to_frame()
+    
+    if date_column is not None and date_column in df.columns:
+        try:
+            dates = _parse_dates(df[date_column])
+        except (TypeError, ValueError, OverflowError) as e:
+            # A column that only looks like a date should not stop the
+            # other summaries; the yearly table is left out instead
+            print(f"Could not parse dates in {date_column}: {e}")
+            dates = None
+        
+        if dates is not None:
+            # Small integer years halve the bytes hashed by value_counts
+            years = dates.dt.year.astype("Int16")
+            by_year = years.value_counts().sort_index().rename("count").to_frame()
+            by_year.index = by_year.index.astype(int)
+            by_year.index.name = "year"
+            cube["by_year"] = by_year
+    
+    return cube
+
+
+def summary_columns(
+    df: pd.DataFrame,
+    state_column: str = "STATE_ABBR",
+    group_column: Optional[str] = None,
+    date_column: Optional[str] = None
+) -> list[str]:
+    """
+    Get the attribute columns build_summary_cube uses for a dataset.
+    
+    Pass a small sample (e.g. one feature) to find out which columns to
+    read before loading the full dataset, so unused attributes are never
+    parsed.
+    
+    Args:
+        df: Sample of the attribute table
+        state_column: Column with state abbreviations
+        group_column: Categorical column to group by (defaults as in
+            build_summary_cube)
+        date_column: Date column for yearly counts (defaults as in
+            build_summary_cube)
+        
+    Returns:
+        Column names, including the numeric columns summarized as statistics
+    """
+    group_column, date_column = _resolve_summary_columns(df, group_column, date_column)
+    numeric_columns = list(df.select_dtypes(include=['number']).columns)
+    
+    return [
+        col for col in dict.fromkeys([state_column, group_column, date_column, *numeric_columns])
+        if col is not None and col in df.columns
+    ]
+
+
+def _resolve_summary_columns(
+    df: pd.DataFrame,
+    group_column: Optional[str],
+    date_column: Optional[str]
+) -> tuple[Optional[str], Optional[str]]:
+    """Fill in the default group and date columns of build_summary_cube."""
+    if group_column is None:
+        text_cols = [
+            col for col in df.columns
+            if isinstance(df[col].dtype, pd.CategoricalDtype)
+            or pd.api.types.is_string_dtype(df[col])
+        ]
+        if "ACTIVITY" in df.columns:
+            group_column = "ACTIVITY"
+        elif text_cols:
+            group_column = text_cols[0]
+    
+    if date_column is None:
+        date_cols = [
+            col for col in df.columns
+            if any(term in col.upper() for term in ['DATE', 'YEAR', 'TIME'])
+        ]
+        date_column = date_cols[0] if date_cols else None
+    
+    return group_column, date_column
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a date column, trying the EDW timestamp format first.
+    
+    A fixed format lets pandas parse in C without inferring the format of
+    every value; only values that do not match fall back to inference.
+    Numeric columns (e.g. fiscal years) are read as years, and categorical
+    columns are parsed once per category.
+    
+    Args:
+        values: Column with dates
+        
+    Returns:
+        Series of datetime64 values (NaT where unparseable)
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        parsed = _parse_dates(pd.Series(values.cat.categories)).to_numpy()
+        # Code -1 (missing) picks the NaT appended at the end
+        lookup = np.append(parsed, np.array(["NaT"], dtype=parsed.dtype))
+        return pd.Series(lookup[values.cat.codes.to_numpy()], index=values.index, name=values.name)
+    
+    if pd.api.types.is_numeric_dtype(values):
+        years = pd.to_numeric(values, errors='coerce').round().astype("Int64").astype("string")
+        return pd.to_datetime(years, format="%Y", errors='coerce').astype("datetime64[s]")
+    
+    dates = pd.to_datetime(values, format="%Y/%m/%d %H:%M:%S", errors='coerce', cache=True)
+    dates = dates.astype("datetime64[s]")
+    
+    missed = dates.isna() & values.notna()
+    if missed.any():
+        # The two passes can come back in different units (and the fallback
+        # possibly time zone aware), so both are brought to naive seconds
+        # before they are combined
+        fallback = pd.to_datetime(values[missed], format="mixed", errors='coerce', cache=True)
+        if getattr(fallback.dtype, "tz", None) is not None:
+            fallback = fallback.dt.tz_convert(None)
+        dates = dates.fillna(fallback.astype("datetime64[s]"))
+    
+    return dates
+
+
+def save_summary_cube(cube: dict[str, pd.DataFrame], output_path: str):
+    """
+    Save summary tables from build_summary_cube to a single Parquet file.
+    
+    Args:
+        cube: Dictionary of summary tables
+        output_path: Output file path
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    tables = {}
+    for name, table in cube.items():
+        table = table.copy()
+        table.index = table.index.astype(str)
+        tables[name] = table
+    
+    combined = pd.concat(tables, names=["summary", "key"])
+    combined.attrs["index_names"] = {name: table.index.name for name, table in cube.items()}
+    combined.to_parquet(output_path)
+    print(f"Saved summaries to {output_path}")
+
+
+def load_summary_cube(path: str) -> dict[str, pd.DataFrame]:
+    """
+    Load summary tables saved with save_summary_cube.
+    
+    Args:
+        path: Path to the Parquet file
+        
+    Returns:
+        Dictionary of summary tables
+    """
+    combined = pd.read_parquet(path)
+    index_names = combined.attrs.get("index_names", {})
+    
+    cube = {}
+    for name in combined.index.get_level_values("summary").unique():
+        table = combined.xs(name, level="summary").dropna(axis=1, how="all").convert_dtypes()
+        
+        # Restore numeric keys (e.g., years), which were stored as text
+        try:
+            table.index = pd.Index(pd.to_numeric(table.index))
+        except (ValueError, TypeError):
+            pass
+        
+        table.index.name = index_names.get(name)
+        cube[name] = table
+    
+    return cube
+
+
+def export_to_geojson(
+    gdf: gpd.GeoDataFrame,
+    output_path: str,
+    line_delimited: bool = False,
+    precision: int = 6
+):
     """
     Export GeoDataFrame to GeoJSON format.
     
+    The file is written by GDAL through pyogrio in a single pass. Output is
+    in WGS84 as required by RFC 7946 and coordinates are rounded, which
+    keeps files for large layers considerably smaller.
+    
     Args:
         gdf: GeoDataFrame to export
         output_path: Output file path
+        line_delimited: If True, write one feature per line (GeoJSONSeq)
+            instead of a single FeatureCollection, so readers can stream it
+        precision: Number of decimal places kept in coordinates
     """
+    import pyogrio
+    
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    gdf.to_file(output_path, driver="GeoJSON")
+    layer_options = {"COORDINATE_PRECISION": precision}
+    if line_delimited:
+        driver = "GeoJSONSeq"
+    else:
+        driver = "GeoJSON"
+        layer_options["RFC7946"] = "YES"
+    
+    pyogrio.write_dataframe(
+        gdf,
+        output_path,
+        driver=driver,
+        use_arrow=True,
+        layer_options=layer_options
+    )
     print(f"Exported to {output_path}")
 
 
@@ -230,35 +1000,76 @@ def merge_datasets(
     if len(gdfs) == 1:
         return gdfs[0]
     
-    # Ensure all have same CRS
+    # Ensure all have same CRS; only frames in another CRS are reprojected,
+    # in parallel since PROJ releases the GIL while transforming
     crs = gdfs[0].crs
-    gdfs = [gdf.to_crs(crs) for gdf in gdfs]
+    to_reproject = [i for i, gdf in enumerate(gdfs) if gdf.crs != crs]
+    if to_reproject:
+        gdfs = list(gdfs)
+        with ThreadPoolExecutor(max_workers=min(len(to_reproject), os.cpu_count() or 1)) as executor:
+            reprojected = executor.map(lambda i: gdfs[i].to_crs(crs), to_reproject)
+            for i, gdf in zip(to_reproject, reprojected):
+                gdfs[i] = gdf
     
-    # Concatenate
-    merged = pd.concat(gdfs, ignore_index=True)
+    # Concatenate; shared categorical columns are first given the same
+    # categories, otherwise pandas falls back to object columns
+    merged = pd.concat(_unify_categories(gdfs), ignore_index=True)
     
     return merged
 
 
+def _unify_categories(frames: list[pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Give categorical columns shared by all frames the same categories.
+    
+    pd.concat only keeps a categorical dtype when the categories match
+    exactly; this lets merged frames keep their compact integer codes.
+    """
+    shared = [
+        col for col in frames[0].columns
+        if all(
+            col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype)
+            for df in frames
+        )
+        and len({df[col].dtype for df in frames}) > 1
+    ]
+    if not shared:
+        return frames
+    
+    categories = {}
+    for col in shared:
+        values = np.concatenate([df[col].cat.categories.to_numpy(dtype=object) for df in frames])
+        categories[col] = pd.unique(values)
+    
+    return [
+        df.assign(**{col: df[col].cat.set_categories(cats) for col, cats in categories.items()})
+        for df in frames
+    ]
+
+
 def create_buffer(
     gdf: gpd.GeoDataFrame,
     distance: float,
-    unit: str = "meters"
+    unit: str = "meters",
+    keep_projected: bool = False
 ) -> gpd.GeoDataFrame:
     """
     Create buffer around geometries.
     
+    Buffering happens in a projected CRS with metre units: the input's own
+    CRS if it already is one, otherwise EPSG:5070 (CONUS Albers).
+    
     Args:
         gdf: GeoDataFrame
         distance: Buffer distance
         unit: Distance unit ('meters', 'kilometers', 'miles', 'feet')
+        keep_projected: If True, return the result in the projected CRS used
+            for buffering instead of converting back to the input CRS. Use
+            this when the result is reprojected or measured afterwards anyway.
         
     Returns:
         GeoDataFrame with buffered geometries
     """
-    # Convert to projected CRS for accurate buffering
-    gdf_proj = gdf.to_crs("EPSG:5070")
-    
     # Convert distance to meters
     conversions = {
         "meters": 1,
@@ -267,14 +1078,25 @@ def create_buffer(
         "feet": 0.3048
     }
     
+    # Validate before the (expensive) reprojection
     if unit not in conversions:
         raise ValueError(f"Unit must be one of: {', '.join(conversions.keys())}")
     
     distance_m = distance * conversions[unit]
     
-    # Create buffer
-    buffered = gdf_proj.copy()
-    buffered.geometry = gdf_proj.geometry.buffer(distance_m)
+    # Convert to projected CRS for accurate buffering, unless the data is
+    # already in one measured in meters
+    if gdf.crs is not None and gdf.crs.is_projected and gdf.crs.axis_info[0].unit_name == "metre":
+        buffered = gdf.copy(deep=False)
+    else:
+        buffered = gdf.to_crs("EPSG:5070")
+    
+    # Buffer all geometries in one vectorized GEOS call; buffered is already
+    # a new frame, so the geometry can be replaced in place
+    buffered[buffered.geometry.name] = shapely.buffer(buffered.geometry.values, distance_m)
+    
+    if keep_projected or buffered.crs == gdf.crs:
+        return buffered
     
     # Convert back to original CRS
     return buffered.to_crs(gdf.crs)
@@ -289,6 +1111,11 @@ def spatial_join(
     """
     Perform spatial join between two GeoDataFrames.
     
+    geopandas queries the spatial index of ``gdf2`` with the geometries of
+    ``gdf1``, except for 'within', which it runs the other way round as
+    'contains'. If the querying side is the smaller input, its geometries
+    are prepared once and stay prepared for later joins against it.
+    
     Args:
         gdf1: First GeoDataFrame
         gdf2: Second GeoDataFrame
@@ -302,5 +1129,20 @@ def spatial_join(
     if gdf1.crs != gdf2.crs:
         gdf2 = gdf2.to_crs(gdf1.crs)
     
+    # The side sjoin builds its STRtree on, and the side it queries with
+    if predicate == "within":
+        tree_side, query_side = gdf1, gdf2
+    else:
+        tree_side, query_side = gdf2, gdf1
+    
+    # Built here so it is kept on the frame for later queries
+    ensure_sindex(tree_side)
+    
+    # Prepare the query geometries once instead of having GEOS prepare
+    # them again for every query; only done for the smaller input, since
+    # prepared geometries hold on to extra memory
+    if len(query_side) <= len(tree_side):
+        shapely.prepare(query_side.geometry.to_numpy())
+    
     return gpd.sjoin(gdf1, gdf2, how=how, predicate=predicate)
 
@@ -2,32 +2,50 @@
 Visualization tools for USDA Forest Service datasets.
 """
 
+import json
+import shutil
+import subprocess
+import warnings
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import Literal, Optional, Union, List
+import numpy as np
+import pandas as pd
 import geopandas as gpd
+import shapely
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.colors import Normalize
+from matplotlib.cm import ScalarMappable
+from matplotlib.collections import PathCollection
+from matplotlib.colors import Normalize, to_hex, to_rgba
+from matplotlib.path import Path as MplPath
 import folium
 from folium import plugins
 import plotly.express as px
 import plotly.graph_objects as go
 
+from usda_forest_viz.utils import export_to_geojson
+
 
 class StaticMapVisualizer:
     """
     Create static map visualizations using matplotlib.
     """
     
-    def __init__(self, style: str = "default"):
+    def __init__(self, style: str = "default", dpi: int = 150):
         """
         Initialize the static map visualizer.
         
+        Map features are drawn rasterized, so saved figures stay small even
+        in vector formats (PDF, SVG) and ``dpi`` sets their resolution.
+        
         Args:
             style: Matplotlib style to use
+            dpi: Resolution of saved figures
         """
         if style != "default":
             plt.style.use(style)
+        
+        self.dpi = dpi
     
     def plot_polygons(
         self,
@@ -40,11 +58,20 @@ class StaticMapVisualizer:
         alpha: float = 0.7,
         edgecolor: str = "black",
         linewidth: float = 0.5,
+        color: Optional[str] = None,
+        backend: Literal["matplotlib", "datashader"] = "matplotlib",
         output_path: Optional[str] = None
     ) -> plt.Figure:
         """
         Plot polygon geometries.
         
+        Polygons are drawn as a single matplotlib collection rather than
+        one artist per feature. For very large datasets, the datashader
+        backend rasterizes the polygons into an image instead (requires
+        the optional ``datashader`` and ``spatialpandas`` packages). The
+        image has no outlines, so edgecolor and linewidth only apply to
+        the matplotlib backend.
+        
         Args:
             gdf: GeoDataFrame to plot
             column: Column to use for coloring
@@ -55,6 +82,8 @@ class StaticMapVisualizer:
             alpha: Transparency (0-1)
             edgecolor: Edge color
             linewidth: Edge line width
+            color: Fill color when no column is given
+            backend: Rendering backend ('matplotlib' or 'datashader')
             output_path: Path to save figure (optional)
             
         Returns:
@@ -63,15 +92,43 @@ class StaticMapVisualizer:
         fig, ax = plt.subplots(figsize=figsize)
         
         # Plot the data
-        gdf.plot(
-            column=column,
-            ax=ax,
-            cmap=cmap,
-            legend=legend,
-            alpha=alpha,
-            edgecolor=edgecolor,
-            linewidth=linewidth
-        )
+        if backend == "datashader":
+            if edgecolor != "black" or linewidth != 0.5:
+                warnings.warn(
+                    "edgecolor and linewidth are ignored by the datashader backend, "
+                    "which does not draw polygon outlines",
+                    stacklevel=2
+                )
+            mappable = self._add_datashader_image(
+                fig, ax, gdf, column=column, cmap=cmap, color=color, alpha=alpha
+            )
+            if legend and mappable is not None:
+                fig.colorbar(mappable, ax=ax, label=column)
+        elif _is_polygonal(gdf):
+            collection = self._add_polygon_collection(
+                ax,
+                gdf,
+                column=column,
+                cmap=cmap,
+                color=color,
+                alpha=alpha,
+                edgecolor=edgecolor,
+                linewidth=linewidth
+            )
+            if legend and column is not None:
+                self._add_legend(fig, ax, collection, gdf[column], cmap)
+        else:
+            gdf.plot(
+                column=column,
+                ax=ax,
+                cmap=cmap,
+                color=color,
+                legend=legend,
+                alpha=alpha,
+                edgecolor=edgecolor,
+                linewidth=linewidth,
+                rasterized=True
+            )
         
         ax.set_title(title, fontsize=16, fontweight='bold')
         ax.set_xlabel("Longitude", fontsize=12)
@@ -86,7 +143,7 @@ class StaticMapVisualizer:
         if output_path:
             # Create directory if it doesn't exist
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            plt.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Figure saved to {output_path}")
         
         return fig
@@ -126,7 +183,8 @@ class StaticMapVisualizer:
             cmap=cmap,
             legend=True,
             markersize=markersize,
-            alpha=alpha
+            alpha=alpha,
+            rasterized=True
         )
         
         ax.set_title(title, fontsize=16, fontweight='bold')
@@ -138,7 +196,7 @@ class StaticMapVisualizer:
         if output_path:
             # Create directory if it doesn't exist
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            plt.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Figure saved to {output_path}")
         
         return fig
@@ -150,6 +208,7 @@ class StaticMapVisualizer:
         title: str = "Choropleth Map",
         cmap: str = "YlOrRd",
         figsize: tuple = (15, 10),
+        backend: Literal["matplotlib", "datashader"] = "matplotlib",
         output_path: Optional[str] = None
     ) -> plt.Figure:
         """
@@ -161,6 +220,7 @@ class StaticMapVisualizer:
             title: Plot title
             cmap: Colormap name
             figsize: Figure size
+            backend: Rendering backend ('matplotlib' or 'datashader')
             output_path: Path to save figure (optional)
             
         Returns:
@@ -168,13 +228,24 @@ class StaticMapVisualizer:
         """
         fig, ax = plt.subplots(figsize=figsize)
         
-        gdf.plot(
-            column=value_column,
-            ax=ax,
-            cmap=cmap,
-            legend=True,
-            legend_kwds={'label': value_column, 'orientation': 'horizontal'}
-        )
+        if backend == "datashader":
+            mappable = self._add_datashader_image(fig, ax, gdf, column=value_column, cmap=cmap)
+            if mappable is not None:
+                fig.colorbar(mappable, ax=ax, label=value_column, orientation='horizontal')
+        elif _is_polygonal(gdf):
+            collection = self._add_polygon_collection(
+                ax, gdf, column=value_column, cmap=cmap
+            )
+            fig.colorbar(collection, ax=ax, label=value_column, orientation='horizontal')
+        else:
+            gdf.plot(
+                column=value_column,
+                ax=ax,
+                cmap=cmap,
+                legend=True,
+                legend_kwds={'label': value_column, 'orientation': 'horizontal'},
+                rasterized=True
+            )
         
         ax.set_title(title, fontsize=16, fontweight='bold')
         ax.axis('off')
@@ -184,11 +255,189 @@ class StaticMapVisualizer:
         if output_path:
             # Create directory if it doesn't exist
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            plt.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Figure saved to {output_path}")
         
         return fig
     
+    def _add_polygon_collection(
+        self,
+        ax: plt.Axes,
+        gdf: gpd.GeoDataFrame,
+        column: Optional[str] = None,
+        cmap: str = "viridis",
+        color: Optional[str] = None,
+        alpha: Optional[float] = None,
+        edgecolor: Optional[str] = None,
+        linewidth: Optional[float] = None
+    ) -> PathCollection:
+        """
+        Draw all polygons of a GeoDataFrame as one PathCollection.
+        
+        Args:
+            ax: Axes to draw on
+            gdf: GeoDataFrame with polygon geometries
+            column: Column to use for coloring (numeric or categorical)
+            cmap: Colormap name
+            color: Fill color when no column is given
+            alpha: Transparency (0-1)
+            edgecolor: Edge color
+            linewidth: Edge line width
+            
+        Returns:
+            The collection added to the axes
+        """
+        paths, feature_index = _polygon_paths(gdf.geometry.values)
+        
+        face_colors = None
+        if column is not None and not pd.api.types.is_numeric_dtype(gdf[column]):
+            # Resolve each category's color once, then gather face colors
+            # by code instead of mapping every feature
+            codes, categories = pd.factorize(gdf[column], sort=True)
+            palette = _category_palette(cmap, len(categories))
+            
+            # The alpha goes into the colors themselves, since a collection
+            # alpha would override the transparent missing-value color
+            if alpha is not None:
+                palette[:, 3] = alpha
+                if isinstance(edgecolor, str) and edgecolor not in ("face", "none"):
+                    edgecolor = to_rgba(edgecolor, alpha)
+                alpha = None
+            
+            # Missing values (code -1) are left transparent
+            palette = np.vstack([palette, [0.0, 0.0, 0.0, 0.0]])
+            face_colors = palette[codes[feature_index]]
+        
+        collection = PathCollection(
+            paths,
+            alpha=alpha,
+            edgecolor=edgecolor,
+            linewidth=linewidth,
+            rasterized=True
+        )
+        
+        if face_colors is not None:
+            collection.set_facecolor(face_colors)
+        elif column is not None:
+            array = gdf[column].to_numpy(dtype=float)
+            collection.set_array(np.ma.masked_invalid(array[feature_index]))
+            collection.set_cmap(cmap)
+        else:
+            collection.set_facecolor(color or "C0")
+        
+        ax.add_collection(collection, autolim=True)
+        ax.autoscale_view()
+        _set_aspect(ax, gdf)
+        
+        return collection
+    
+    def _add_datashader_image(
+        self,
+        fig: plt.Figure,
+        ax: plt.Axes,
+        gdf: gpd.GeoDataFrame,
+        column: Optional[str] = None,
+        cmap: str = "viridis",
+        color: Optional[str] = None,
+        alpha: float = 1.0
+    ) -> Optional[ScalarMappable]:
+        """
+        Rasterize polygons with datashader and draw the image on the axes.
+        
+        Each pixel shows the mean of a numeric column over the polygons
+        covering it, or the number of polygons when no numeric column is given.
+        Counts are shaded with the colormap, or as an opacity ramp of a single
+        color when one is given.
+        
+        Args:
+            fig: Figure containing the axes (sets the raster size)
+            ax: Axes to draw on
+            gdf: GeoDataFrame with polygon geometries
+            column: Numeric column to aggregate
+            cmap: Colormap name
+            color: Fill color for counts when no numeric column is given
+            alpha: Transparency of the image (0-1)
+            
+        Returns:
+            Mappable for a colorbar, or None when only counts were drawn
+            
+        Raises:
+            ImportError: If datashader or spatialpandas is not installed
+        """
+        try:
+            import datashader
+            import datashader.transfer_functions as tf
+            import spatialpandas
+        except ImportError as e:
+            raise ImportError(
+                "The datashader backend requires the 'datashader' and 'spatialpandas' "
+                "packages. Install them with: pip install 'usda-forest-viz[datashader]'"
+            ) from e
+        
+        minx, miny, maxx, maxy = gdf.total_bounds
+        width, height = (int(size * fig.dpi) for size in fig.get_size_inches())
+        canvas = datashader.Canvas(
+            plot_width=width,
+            plot_height=height,
+            x_range=(minx, maxx),
+            y_range=(miny, maxy)
+        )
+        
+        geometry = gdf.geometry.name
+        numeric = column is not None and pd.api.types.is_numeric_dtype(gdf[column])
+        columns = [column, geometry] if numeric else [geometry]
+        
+        agg = canvas.polygons(
+            spatialpandas.GeoDataFrame(gdf[columns]),
+            geometry=geometry,
+            agg=datashader.mean(column) if numeric else datashader.count()
+        )
+        colormap = plt.get_cmap(cmap)
+        
+        # A single color string makes datashader ramp its opacity with the count
+        shade_cmap = to_hex(color) if color is not None and not numeric else colormap
+        image = tf.shade(agg, cmap=shade_cmap, how="linear")
+        
+        ax.imshow(image.to_pil(), extent=(minx, maxx, miny, maxy), alpha=alpha)
+        _set_aspect(ax, gdf)
+        
+        if not numeric:
+            return None
+        
+        norm = Normalize(vmin=float(agg.min()), vmax=float(agg.max()))
+        return ScalarMappable(norm=norm, cmap=colormap)
+    
+    def _add_legend(
+        self,
+        fig: plt.Figure,
+        ax: plt.Axes,
+        collection: PathCollection,
+        values,
+        cmap: str
+    ):
+        """
+        Add a colorbar (numeric values) or category legend to a plot.
+        
+        Args:
+            fig: Figure containing the axes
+            ax: Axes the collection was drawn on
+            collection: Collection colored by the values
+            values: Series the colors were derived from
+            cmap: Colormap name used for the collection
+        """
+        if pd.api.types.is_numeric_dtype(values):
+            fig.colorbar(collection, ax=ax)
+            return
+        
+        # Same ordering and palette as used for the collection colors
+        _, categories = pd.factorize(values, sort=True)
+        palette = _category_palette(cmap, len(categories))
+        handles = [
+            mpatches.Patch(color=palette[code], label=str(category))
+            for code, category in enumerate(categories)
+        ]
+        ax.legend(handles=handles, loc='best')
+    
     def create_comparison_map(
         self,
         gdfs: List[gpd.GeoDataFrame],
@@ -199,6 +448,9 @@ class StaticMapVisualizer:
         """
         Create side-by-side comparison of multiple datasets.
         
+        All maps share the same extent (the combined bounds of the datasets),
+        so they can be compared directly.
+        
         Args:
             gdfs: List of GeoDataFrames to plot
             titles: List of titles for each subplot
@@ -214,8 +466,19 @@ class StaticMapVisualizer:
         if n_plots == 1:
             axes = [axes]
         
+        # Combined extent of all datasets (empty ones have NaN bounds)
+        bounds = np.vstack([gdf.total_bounds for gdf in gdfs])
+        bounds = bounds[np.isfinite(bounds).all(axis=1)]
+        if len(bounds) > 0:
+            minx, miny = bounds[:, :2].min(axis=0)
+            maxx, maxy = bounds[:, 2:].max(axis=0)
+        
         for i, (gdf, title) in enumerate(zip(gdfs, titles)):
-            gdf.plot(ax=axes[i], alpha=0.7)
+            gdf.plot(ax=axes[i], alpha=0.7, rasterized=True)
+            if len(bounds) > 0:
+                axes[i].set_xlim(minx, maxx)
+                axes[i].set_ylim(miny, maxy)
+                axes[i].set_autoscale_on(False)
             axes[i].set_title(title, fontsize=14, fontweight='bold')
             axes[i].axis('off')
         
@@ -224,17 +487,112 @@ class StaticMapVisualizer:
         if output_path:
             # Create directory if it doesn't exist
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            plt.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Figure saved to {output_path}")
         
         return fig
 
 
+def _is_polygonal(gdf: gpd.GeoDataFrame) -> bool:
+    """Check whether all non-missing geometries are (multi)polygons."""
+    geom_types = gdf.geom_type.dropna()
+    return len(geom_types) > 0 and geom_types.isin(["Polygon", "MultiPolygon"]).all()
+
+
+def _polygon_paths(geometries) -> tuple[list, np.ndarray]:
+    """
+    Convert polygon geometries to matplotlib paths in bulk.
+    
+    Coordinates of all rings are extracted with vectorized shapely calls,
+    and each polygon part becomes one compound path so holes are kept.
+    
+    Args:
+        geometries: Array of Polygon/MultiPolygon geometries
+        
+    Returns:
+        List of paths and, for each path, the index of its source feature
+    """
+    parts, part_index = shapely.get_parts(geometries, return_index=True)
+    keep = ~shapely.is_empty(parts)
+    parts, part_index = parts[keep], part_index[keep]
+    
+    rings, ring_index = shapely.get_rings(parts, return_index=True)
+    coords, coord_index = shapely.get_coordinates(rings, return_index=True)
+    
+    # Every ring starts with MOVETO and ends with CLOSEPOLY
+    ring_starts = np.searchsorted(coord_index, np.arange(len(rings)))
+    ring_ends = np.append(ring_starts[1:], len(coords)) - 1
+    codes = np.full(len(coords), MplPath.LINETO, dtype=MplPath.code_type)
+    codes[ring_starts] = MplPath.MOVETO
+    codes[ring_ends] = MplPath.CLOSEPOLY
+    
+    # Split coordinates and codes into one path per polygon part
+    part_starts = ring_starts[np.searchsorted(ring_index, np.arange(len(parts)))]
+    splits = part_starts[1:]
+    paths = [
+        MplPath(vertices, path_codes)
+        for vertices, path_codes in zip(np.split(coords, splits), np.split(codes, splits))
+    ]
+    
+    return paths, part_index
+
+
+def _category_palette(cmap: str, n_categories: int) -> np.ndarray:
+    """
+    Sample evenly spaced RGBA colors from a colormap, one per category.
+    
+    Args:
+        cmap: Colormap name
+        n_categories: Number of categories
+        
+    Returns:
+        Array of shape (n_categories, 4)
+    """
+    return plt.get_cmap(cmap)(np.linspace(0, 1, n_categories))
+
+
+def _set_aspect(ax: plt.Axes, gdf: gpd.GeoDataFrame):
+    """Set the axes aspect ratio the same way GeoDataFrame.plot does."""
+    if gdf.crs and gdf.crs.is_geographic:
+        miny, maxy = gdf.total_bounds[[1, 3]]
+        ax.set_aspect(1 / np.cos(np.radians((miny + maxy) / 2)))
+    else:
+        ax.set_aspect("equal")
+
+
+def _map_center(gdf: gpd.GeoDataFrame) -> tuple[float, float]:
+    """
+    Get the (lat, lon) center of a WGS84 GeoDataFrame's bounding box.
+    
+    This reads the bounds in a single pass instead of building a centroid
+    for every feature.
+    """
+    minx, miny, maxx, maxy = gdf.total_bounds
+    return (miny + maxy) / 2, (minx + maxx) / 2
+
+
+def _feature_collection(geometries, ids) -> dict:
+    """
+    Build a GeoJSON FeatureCollection of bare geometries keyed by ``ids``.
+    
+    Geometries are written to GeoJSON by GEOS and parsed in one json.loads
+    call, instead of being converted to nested Python dicts one by one.
+    """
+    features = ",".join(
+        f'{{"type":"Feature","id":{json.dumps(feature_id)},"geometry":{geometry or "null"}}}'
+        for feature_id, geometry in zip(ids, shapely.to_geojson(geometries))
+    )
+    return json.loads(f'{{"type":"FeatureCollection","features":[{features}]}}')
+
+
 class InteractiveMapVisualizer:
     """
     Create interactive map visualizations using Folium.
     """
     
+    # Palette cycled through for the values of the style column
+    COLORS = ['#e41a1c', '#377eb8', '#4daf4a', '#984ea3', '#ff7f00', '#ffff33', '#a65628', '#f781bf']
+    
     def __init__(self):
         """Initialize the interactive map visualizer."""
         pass
@@ -248,7 +606,9 @@ class InteractiveMapVisualizer:
         popup_fields: Optional[List[str]] = None,
         tooltip_fields: Optional[List[str]] = None,
         color: str = "blue",
-        fill_opacity: float = 0.6
+        fill_opacity: float = 0.6,
+        simplify_tolerance: Optional[float] = 0.0001,
+        cluster: bool = False
     ) -> folium.Map:
         """
         Create an interactive Folium map.
@@ -262,6 +622,11 @@ class InteractiveMapVisualizer:
             tooltip_fields: Fields to show in tooltip
             color: Default color
             fill_opacity: Fill opacity
+            simplify_tolerance: Tolerance in degrees for simplifying geometries
+                before they are written to the map (None or 0 disables)
+            cluster: If True, draw points (and the centers of other features)
+                as client-side marker clusters; the full shapes are added as
+                a layer that is hidden until switched on
             
         Returns:
             Folium map object
@@ -270,8 +635,15 @@ class InteractiveMapVisualizer:
         if gdf.crs != "EPSG:4326":
             gdf = gdf.to_crs("EPSG:4326")
         
+        # Drop vertices that are invisible at web map scales; this shrinks
+        # the HTML output and the number of SVG path segments to draw
+        if simplify_tolerance:
+            gdf = gdf.set_geometry(
+                gdf.geometry.simplify(simplify_tolerance, preserve_topology=True)
+            )
+        
         # Calculate center
-        center = [gdf.geometry.centroid.y.mean(), gdf.geometry.centroid.x.mean()]
+        center = list(_map_center(gdf))
         
         # Create map
         m = folium.Map(
@@ -284,51 +656,90 @@ class InteractiveMapVisualizer:
         folium.LayerControl().add_to(m)
         
         # Create feature group
-        fg = folium.FeatureGroup(name="USDA Forest Service Data")
-        
-        # Add geometries
-        for idx, row in gdf.iterrows():
-            # Create popup content
-            popup_html = "<div style='width: 200px'>"
-            if popup_fields:
-                for field in popup_fields:
-                    if field in row:
-                        popup_html += f"<b>{field}:</b> {row[field]}<br>"
-            popup_html += "</div>"
+        fg = folium.FeatureGroup(name="USDA Forest Service Data", show=not cluster)
+        
+        # Geometry types are looked up once and reused to split the layers;
+        # the same point mask decides what is clustered and what is drawn
+        geom_types = gdf.geom_type.to_numpy()
+        is_point = np.isin(geom_types, ["Point", "MultiPoint"])
+        is_line = np.isin(geom_types, ["LineString", "MultiLineString", "LinearRing"])
+        
+        if cluster:
+            # Points are only drawn as clusters; other features also get a
+            # clustered marker at a point guaranteed to lie inside them
+            centers = gdf.geometry.representative_point()
+            centers = centers[centers.notna() & ~centers.is_empty]
+            
+            locations = np.column_stack([centers.y.to_numpy(), centers.x.to_numpy()])
+            plugins.FastMarkerCluster(
+                data=locations.tolist(),
+                name="Feature clusters"
+            ).add_to(m)
             
-            # Create tooltip content
-            tooltip_html = None
-            if tooltip_fields:
-                tooltip_html = "<br>".join([f"<b>{field}:</b> {row[field]}" for field in tooltip_fields if field in row])
+            gdf = gdf[~is_point]
+            is_line = is_line[~is_point]
+            is_point = np.zeros(len(gdf), dtype=bool)
+        
+        # Only serialize the attributes the map actually uses
+        fields = [
+            field for field in dict.fromkeys((popup_fields or []) + (tooltip_fields or []))
+            if field in gdf.columns
+        ]
+        
+        # Resolve each feature's color once up front and ship it as a
+        # property, so the style function only reads it back
+        if style_column and style_column in gdf.columns:
+            gdf = gdf.assign(_color=self._assign_colors(gdf, style_column, color))
+            fields.append("_color")
+        
+        def style_function(feature):
+            return {
+                'fillColor': feature["properties"].get("_color", color),
+                'color': 'black',
+                'weight': 1,
+                'fillOpacity': fill_opacity
+            }
+        
+        def line_style_function(feature):
+            return {
+                'color': feature["properties"].get("_color", color),
+                'weight': 2
+            }
+        
+        popup_fields = [field for field in popup_fields or [] if field in gdf.columns]
+        tooltip_fields = [field for field in tooltip_fields or [] if field in gdf.columns]
+        
+        # Add geometries as one GeoJson layer per kind: polygons as filled
+        # paths, lines as paths stroked in the feature color and points as
+        # circle markers
+        for mask, layer_style, marker in (
+            (~(is_point | is_line), style_function, None),
+            (is_line, line_style_function, None),
+            (is_point, style_function, folium.CircleMarker(radius=5, fill=True))
+        ):
+            if not mask.any():
+                continue
             
-            # Determine color
-            feature_color = color
-            if style_column and style_column in row:
-                # Simple color mapping - can be enhanced
-                feature_color = self._get_color_for_value(row[style_column])
+            subset = gdf[mask]
             
-            # Add geometry based on type
-            if row.geometry.geom_type == 'Point':
-                folium.CircleMarker(
-                    location=[row.geometry.y, row.geometry.x],
-                    radius=5,
-                    color=feature_color,
-                    fill=True,
-                    popup=folium.Popup(popup_html, max_width=300),
-                    tooltip=tooltip_html
-                ).add_to(fg)
-            else:
-                folium.GeoJson(
-                    row.geometry.__geo_interface__,
-                    style_function=lambda x, c=feature_color: {
-                        'fillColor': c,
-                        'color': 'black',
-                        'weight': 1,
-                        'fillOpacity': fill_opacity
-                    },
-                    popup=folium.Popup(popup_html, max_width=300),
-                    tooltip=tooltip_html
-                ).add_to(fg)
+            # Popup and tooltip HTML is templated by Leaflet in the browser
+            # from the feature properties, so no markup is built per feature
+            popup = folium.GeoJsonPopup(fields=popup_fields) if popup_fields else None
+            tooltip = folium.GeoJsonTooltip(
+                fields=tooltip_fields,
+                aliases=tooltip_fields,
+                sticky=False
+            ) if tooltip_fields else None
+            
+            # JSON has no date type; datetimes (e.g. the EDW DATE_* fields)
+            # and other non-JSON values are written as their string form
+            folium.GeoJson(
+                subset[fields + [subset.geometry.name]].to_json(default=str),
+                style_function=layer_style,
+                marker=marker,
+                popup=popup,
+                tooltip=tooltip
+            ).add_to(fg)
         
         fg.add_to(m)
         
@@ -340,18 +751,124 @@ class InteractiveMapVisualizer:
         
         return m
     
-    def _get_color_for_value(self, value) -> str:
+    def create_tiled_map(
+        self,
+        gdf: gpd.GeoDataFrame,
+        output_dir: Union[str, Path],
+        zoom_start: int = 6,
+        tiles: str = "OpenStreetMap",
+        color: str = "blue",
+        fill_opacity: float = 0.6
+    ) -> folium.Map:
+        """
+        Create an interactive map that draws the data from vector tiles.
+        
+        Intended for layers too large to embed in the page (roughly 50k+
+        features): the data is cut into Mapbox vector tiles with tippecanoe
+        (which must be installed and on PATH), and the browser only loads
+        the tiles in view. Tiles are written to ``output_dir/tiles`` and
+        referenced by a relative URL, so save the map into ``output_dir``
+        and serve that directory over HTTP (e.g., ``python -m http.server``).
+        
+        Args:
+            gdf: GeoDataFrame to plot
+            output_dir: Directory to write the tiles to
+            zoom_start: Initial zoom level
+            tiles: Base map tiles
+            color: Feature color
+            fill_opacity: Fill opacity
+            
+        Returns:
+            Folium map object
+            
+        Raises:
+            RuntimeError: If tippecanoe is not installed
+        """
+        tippecanoe = shutil.which("tippecanoe")
+        if tippecanoe is None:
+            raise RuntimeError(
+                "create_tiled_map requires tippecanoe; "
+                "see https://github.com/felt/tippecanoe for installation"
+            )
+        
+        # Ensure CRS is WGS84 for web mapping
+        if gdf.crs != "EPSG:4326":
+            gdf = gdf.to_crs("EPSG:4326")
+        
+        output_dir = Path(output_dir)
+        features_path = output_dir / "features.geojsonl"
+        tiles_dir = output_dir / "tiles"
+        
+        # Stream the features to tippecanoe as line-delimited GeoJSON
+        export_to_geojson(gdf, features_path, line_delimited=True)
+        
+        print(f"Building vector tiles in {tiles_dir}...")
+        try:
+            subprocess.run(
+                [
+                    tippecanoe,
+                    "--output-to-directory", str(tiles_dir),
+                    "--layer", "features",
+                    "--maximum-zoom", "g",
+                    "--drop-densest-as-needed",
+                    "--no-tile-compression",
+                    "--force",
+                    str(features_path)
+                ],
+                check=True
+            )
+        finally:
+            features_path.unlink(missing_ok=True)
+        
+        m = folium.Map(
+            location=list(_map_center(gdf)),
+            zoom_start=zoom_start,
+            tiles=tiles
+        )
+        
+        plugins.VectorGridProtobuf(
+            url="tiles/{z}/{x}/{y}.pbf",
+            name="USDA Forest Service Data",
+            options={
+                "vectorTileLayerStyles": {
+                    "features": {
+                        "fill": True,
+                        "fillColor": color,
+                        "fillOpacity": fill_opacity,
+                        "color": "black",
+                        "weight": 1,
+                        "radius": 5
+                    }
+                }
+            }
+        ).add_to(m)
+        
+        folium.LayerControl().add_to(m)
+        
+        # Add fullscreen button
+        plugins.Fullscreen().add_to(m)
+        
+        return m
+    
+    def _assign_colors(self, gdf: gpd.GeoDataFrame, column: str, default: str) -> np.ndarray:
         """
-        Get a color for a value (simple hash-based coloring).
+        Get a color for every row from the values of a column.
+        
+        Each distinct value gets a palette color by its category code, so
+        the colors are picked with one array lookup.
         
         Args:
-            value: Value to get color for
+            gdf: GeoDataFrame to color
+            column: Column to color by
+            default: Color for missing values
             
         Returns:
-            Color hex code
+            Array of color hex codes, one per row
         """
-        colors = ['#e41a1c', '#377eb8', '#4daf4a', '#984ea3', '#ff7f00', '#ffff33', '#a65628', '#f781bf']
-        return colors[hash(str(value)) % len(colors)]
+        codes = gdf[column].astype("category").cat.codes.to_numpy()
+        colors = np.asarray(self.COLORS, dtype=object)[codes % len(self.COLORS)]
+        colors[codes < 0] = default
+        return colors
     
     def save_map(self, m: folium.Map, output_path: str):
         """
@@ -382,7 +899,8 @@ class PlotlyVisualizer:
         color_column: Optional[str] = None,
         hover_data: Optional[List[str]] = None,
         title: str = "USDA Forest Service Data",
-        mapbox_style: str = "open-street-map"
+        mapbox_style: str = "open-street-map",
+        simplify_tolerance: Optional[float] = 0.0001
     ) -> go.Figure:
         """
         Create an interactive Plotly map.
@@ -393,6 +911,8 @@ class PlotlyVisualizer:
             hover_data: Columns to show on hover
             title: Map title
             mapbox_style: Mapbox style
+            simplify_tolerance: Tolerance in degrees for simplifying geometries
+                before they are written to the figure (None or 0 disables)
             
         Returns:
             Plotly figure object
@@ -401,15 +921,22 @@ class PlotlyVisualizer:
         if gdf.crs != "EPSG:4326":
             gdf = gdf.to_crs("EPSG:4326")
         
+        if simplify_tolerance:
+            gdf = gdf.set_geometry(
+                gdf.geometry.simplify(simplify_tolerance, preserve_topology=True)
+            )
+        
+        ids = gdf.index.astype(str)
+        
         fig = px.choropleth_mapbox(
             gdf,
-            geojson=gdf.geometry.__geo_interface__,
-            locations=gdf.index,
+            geojson=_feature_collection(gdf.geometry.values, ids),
+            featureidkey="id",
+            locations=ids,
             color=color_column,
             hover_data=hover_data,
             mapbox_style=mapbox_style,
-            center={"lat": gdf.geometry.centroid.y.mean(), 
-                   "lon": gdf.geometry.centroid.x.mean()},
+            center=dict(zip(("lat", "lon"), _map_center(gdf))),
             zoom=6,
             title=title
         )
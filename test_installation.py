@@ -98,6 +98,31 @@ def test_visualizers():
         interactive_viz = InteractiveMapVisualizer()
         print("  ✓ InteractiveMapVisualizer initialized")
         
+        # Popups and tooltips must handle date fields (e.g. DATE_COMPLETED)
+        import geopandas as gpd
+        import pandas as pd
+        from shapely.geometry import Point, box
+        
+        gdf = gpd.GeoDataFrame(
+            {
+                "STATE_ABBR": ["CA", "OR", None],
+                "DATE_COMPLETED": pd.to_datetime(["2020-05-01", None, "2021-07-15"])
+            },
+            geometry=[box(-120, 38, -119, 39), box(-122, 44, -121, 45), Point(-118, 36)],
+            crs="EPSG:4326"
+        )
+        m = interactive_viz.create_map(
+            gdf,
+            style_column="STATE_ABBR",
+            popup_fields=["STATE_ABBR", "DATE_COMPLETED"],
+            tooltip_fields=["DATE_COMPLETED"]
+        )
+        html = m.get_root().render()
+        if "2020-05-01" not in html:
+            print("  ✗ Date popup field missing from map")
+            return False
+        print("  ✓ Interactive map with date popup fields created")
+        
         return True
     except Exception as e:
         print(f"  ✗ Error: {e}")
@@ -128,6 +153,47 @@ def test_utils():
                 print(f"  ✗ {func_name} not found")
                 return False
         
+        # Code columns are loaded as categoricals, and filtering drops the
+        # categories that no longer occur
+        import geopandas as gpd
+        from shapely.geometry import Point
+        
+        gdf = gpd.GeoDataFrame(
+            {"STATE_ABBR": ["CA", "OR", "CA", "WA"]},
+            geometry=[Point(0, 0)] * 4,
+            crs="EPSG:4326"
+        )
+        gdf = utils._categorize(gdf)
+        if gdf["STATE_ABBR"].dtype != "category":
+            print("  ✗ STATE_ABBR was not stored as a categorical")
+            return False
+        
+        california = utils.filter_by_attribute(gdf, "STATE_ABBR", "CA")
+        if list(california["STATE_ABBR"].cat.categories) != ["CA"]:
+            print("  ✗ filter_by_attribute kept unused categories")
+            return False
+        print("  ✓ Categorical attribute filtering works")
+        
+        # Other repetitive text columns are detected by their cardinality,
+        # whatever text dtype the installed pandas uses
+        import datetime
+        import pandas as pd
+        
+        df = utils._categorize(pd.DataFrame({
+            "FOREST_NAME": ["Shasta-Trinity", "Klamath"] * 50,
+            "SUID": [f"{i:019d}" for i in range(100)],
+            # DBF Date fields can arrive as object columns of datetime.date
+            "DATE_AWARDED": pd.Series([datetime.date(2020, 5, 1)] * 100, dtype=object),
+            "MIXED": pd.Series([1, "a"] * 50, dtype=object)
+        }))
+        if df["FOREST_NAME"].dtype != "category" or df["SUID"].dtype == "category":
+            print("  ✗ Low-cardinality text columns not detected")
+            return False
+        if df["DATE_AWARDED"].dtype == "category" or df["MIXED"].dtype == "category":
+            print("  ✗ Non-text object columns stored as categoricals")
+            return False
+        print("  ✓ Low-cardinality text columns stored as categoricals")
+        
         return True
     except Exception as e:
         print(f"  ✗ Error: {e}")